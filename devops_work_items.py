@@ -3,23 +3,161 @@ import subprocess
 import sys
 import logging
 import os
+import atexit
+import base64
+import configparser
+import contextlib
+import hashlib
+import importlib.util
+import io
+import multiprocessing
+import pickle
+import queue
+import sqlite3
+import threading
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
+from logging.handlers import QueueHandler, QueueListener
+from urllib.parse import quote
 import fire
+import requests
+
+# orjson is an optional, faster drop-in for encoding and decoding JSON
+try:
+    import orjson as _json
+    _json_dumps = _json.dumps
+except ImportError:
+    import json as _json
+    
+    def _json_dumps(obj):
+        return _json.dumps(obj).encode()
+
+# Prefer the libyaml C bindings, fall back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Azure DevOps REST API version used for all requests
+API_VERSION = "7.1"
+JSON_PATCH_HEADERS = {"Content-Type": "application/json-patch+json"}
+# Maximum number of operations accepted by a single $batch request
+BATCH_SIZE = 200
+# WIQL queries are limited to 32K characters, keep some headroom
+WIQL_MAX_LENGTH = 32000
+# Upper bound on concurrent Azure DevOps calls
+MAX_WORKERS = 16
+# Parsed YAML files, keyed by path and validated against mtime and size
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "devops-wic")
+# Work items saved by create for a later delete, and the pre-JSON format
+CREATED_ITEMS_FILE = "created_items.json"
+LEGACY_CREATED_ITEMS_FILE = "created_items.yaml"
+
+def new_created_items():
+    """Return an empty created items record.
+    
+    Created work items are stored as parallel lists rather than one dict per
+    work item, which keeps large trees compact in memory and on disk.
+    """
+    return {"types": [], "ids": [], "titles": []}
+
+def add_created_item(created_items, work_item_type, work_item_id, title):
+    """Append one work item to a created items record."""
+    created_items["types"].append(work_item_type)
+    created_items["ids"].append(work_item_id)
+    created_items["titles"].append(title)
+
+def title_occurrences(entries):
+    """Number each entry by how many earlier siblings share its title.
+    
+    Siblings may repeat a title, the occurrence keeps their cache keys apart.
+    """
+    seen = {}
+    occurrences = []
+    for entry in entries:
+        occurrence = seen.get(entry['title'], 0)
+        seen[entry['title']] = occurrence + 1
+        occurrences.append(occurrence)
+    return occurrences
+
+# Azure CLI instance of an az worker process, created once per process
+_az_worker_cli = None
+
+def _init_az_worker():
+    """Load the Azure CLI in a freshly started az worker process."""
+    global _az_worker_cli
+    from azure.cli.core import get_default_cli
+    _az_worker_cli = get_default_cli()
+
+def _invoke_az(args):
+    """Run one az command on the Azure CLI instance of this worker process.
+    
+    Args:
+        args (list): az arguments, without the leading "az"
+        
+    Returns:
+        tuple: Return code, captured stdout and captured stderr
+    """
+    # knack sets the root logger to DEBUG and attaches console handlers on
+    # every invocation, so restore the logging setup afterwards
+    root_logger = logging.getLogger()
+    cli_logger = logging.getLogger("cli")
+    saved = (root_logger.level, root_logger.handlers[:],
+             cli_logger.level, cli_logger.handlers[:], cli_logger.propagate)
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        with contextlib.redirect_stderr(stderr):
+            returncode = _az_worker_cli.invoke(args, out_file=stdout)
+    except SystemExit as e:
+        returncode = e.code
+    finally:
+        root_logger.setLevel(saved[0])
+        root_logger.handlers[:] = saved[1]
+        cli_logger.setLevel(saved[2])
+        cli_logger.handlers[:] = saved[3]
+        cli_logger.propagate = saved[4]
+    
+    # SystemExit codes may be None or a message rather than an int
+    if returncode is None:
+        returncode = 0
+    elif not isinstance(returncode, int):
+        stderr.write(str(returncode))
+        returncode = 1
+    return returncode, stdout.getvalue(), stderr.getvalue()
 
 # Configure logging
+_log_listener = None
+
 def setup_logging(log_level=logging.INFO):
-    log_format = '%(asctime)s - %(levelname)s - %(message)s'
-    logging.basicConfig(
-        level=log_level,
-        format=log_format,
-        handlers=[
+    # Records are queued on the calling thread and written to the console
+    # and devops.log by a background listener thread
+    global _log_listener
+    root = logging.getLogger()
+    root.setLevel(log_level)
+    if _log_listener is None:
+        log_format = '%(asctime)s - %(levelname)s - %(message)s'
+        handlers = [
             logging.StreamHandler(),  # Console handler
             logging.FileHandler(os.path.join(os.path.dirname(__file__), 'devops.log'))  # File handler
         ]
-    )
+        for handler in handlers:
+            handler.setFormatter(logging.Formatter(log_format))
+        
+        log_queue = queue.Queue(-1)
+        root.addHandler(QueueHandler(log_queue))
+        _log_listener = QueueListener(log_queue, *handlers)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
     return logging.getLogger(__name__)
 
-# Initialize logger
-logger = setup_logging()
+# Initialize logger. az worker processes re-import this module and must not
+# attach handlers, or the DEBUG records knack enables would reach devops.log.
+if multiprocessing.current_process().name == "MainProcess":
+    logger = setup_logging()
+else:
+    logger = logging.getLogger(__name__)
 
 class DevOpsWorkItems:
     """Create and manage Azure DevOps work items from YAML definitions.
@@ -29,16 +167,100 @@ class DevOpsWorkItems:
     and Product Backlog Items with proper parent-child relationships.
     """
     
-    def __init__(self, debug=False):
+    # Invariant start of the title lookup query, and the WIQL string escape table
+    _WIQL_PREFIX = "SELECT [System.Id], [System.Title] FROM WorkItems WHERE [System.WorkItemType] = '"
+    _QUOTE_ESCAPE = str.maketrans({"'": "''"})
+    
+    # Invariant parts of the az command lines, extended per call
+    _CREATE_PREFIX = ("az", "boards", "work-item", "create", "--query", "id", "-o", "tsv")
+    _LINK_PREFIX = ("az", "boards", "work-item", "relation", "add", "--relation-type", "Parent")
+    _DELETE_PREFIX = ("az", "boards", "work-item", "delete", "--yes", "--id")  # --yes skips the prompt
+    _QUERY_PREFIX = ("az", "boards", "query", "-o", "json", "--wiql")
+    
+    def __init__(self, debug=False, use_cli=False, organization=None, project=None):
         """Initialize the DevOpsWorkItems tool.
         
         Args:
             debug (bool): Enable debug logging
+            use_cli (bool): Use the Azure CLI instead of the REST API
+            organization (str, optional): Organization URL, defaults to AZURE_DEVOPS_ORG_URL
+            project (str, optional): Project name, defaults to AZURE_DEVOPS_PROJECT
         """
         global logger
         if debug:
             logger = setup_logging(logging.DEBUG)
             logger.debug("Debug logging enabled")
+        
+        self._use_cli = use_cli
+        self._session = None
+        # Shared pool for independent calls (e.g. sibling work items)
+        self._executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        if use_cli:
+            # Keep az loaded in long-lived worker processes when azure-cli is importable.
+            # Each worker has its own Azure CLI state, so calls still run concurrently.
+            self._az_pool = None
+            try:
+                azure_cli_found = importlib.util.find_spec("azure.cli.core") is not None
+            except ModuleNotFoundError:
+                azure_cli_found = False
+            if azure_cli_found:
+                self._az_pool = ProcessPoolExecutor(
+                    max_workers=MAX_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_az_worker
+                )
+            else:
+                logger.debug("azure-cli is not importable, running az as a subprocess")
+            
+            # An explicit organization and project are passed to every az command,
+            # otherwise az uses its configured defaults
+            self._org_url = (organization or os.environ.get("AZURE_DEVOPS_ORG_URL", "")).rstrip("/")
+            self._project = project or os.environ.get("AZURE_DEVOPS_PROJECT")
+            self._az_org_args = ("--org", self._org_url) if self._org_url else ()
+            self._az_target_args = self._az_org_args + (("--project", self._project) if self._project else ())
+            if not (self._org_url and self._project):
+                default_org, default_project = self._az_defaults()
+                self._org_url = self._org_url or default_org
+                self._project = self._project or default_project
+            
+            # Without a known organization and project the cache cannot be scoped safely
+            self._cache_scope = None
+            if self._org_url and self._project:
+                self._cache_scope = f"{self._org_url}/{self._project}"
+            else:
+                logger.warning("Could not determine the Azure DevOps organization and project, "
+                               "existing work items will not be skipped")
+        else:
+            # One pooled HTTPS session for all REST calls, authenticated with a PAT
+            self._org_url = (organization or os.environ.get("AZURE_DEVOPS_ORG_URL", "")).rstrip("/")
+            self._project = project or os.environ.get("AZURE_DEVOPS_PROJECT")
+            pat = os.environ.get("AZURE_DEVOPS_EXT_PAT")
+            if not (self._org_url and self._project and pat):
+                print("Error: set AZURE_DEVOPS_ORG_URL, AZURE_DEVOPS_PROJECT and AZURE_DEVOPS_EXT_PAT, "
+                      "or run with --use_cli")
+                sys.exit(1)
+            
+            token = base64.b64encode(f":{pat}".encode()).decode()
+            self._session = requests.Session()
+            # Keep a connection per worker, the default pool of 10 would discard the rest
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=MAX_WORKERS)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+            self._session.headers.update({
+                "Authorization": f"Basic {token}",
+                "Accept": "application/json"
+            })
+            self._cache_scope = f"{self._org_url}/{self._project}"
+        
+        # Local record of created work items, so re-runs skip existing ones
+        self._cache_lock = threading.Lock()
+        self._cache = sqlite3.connect(os.path.join(os.path.dirname(__file__), "wic_cache.db"),
+                                      check_same_thread=False)
+        self._cache.execute(
+            "CREATE TABLE IF NOT EXISTS items("
+            "scope TEXT, parent TEXT, type TEXT, title TEXT, occurrence INTEGER, id TEXT, "
+            "PRIMARY KEY(scope, parent, type, title, occurrence))"
+        )
     
     def create(self, yaml_file="input.yaml"):
         """Create work items defined in the YAML file.
@@ -48,8 +270,7 @@ class DevOpsWorkItems:
         """
         logger.info(f"Creating work items from {yaml_file}")
         try:
-            with open(yaml_file, 'r') as file:
-                data = yaml.safe_load(file)
+            data = self._load_yaml(yaml_file)
             self._create_work_items(data)
         except FileNotFoundError:
             print(f"Error: YAML file not found: {yaml_file}")
@@ -67,8 +288,7 @@ class DevOpsWorkItems:
         """
         logger.info(f"Deleting work items from {yaml_file}")
         try:
-            with open(yaml_file, 'r') as file:
-                data = yaml.safe_load(file)
+            data = self._load_yaml(yaml_file)
             self._delete_work_items(data)
         except FileNotFoundError:
             print(f"Error: YAML file not found: {yaml_file}")
@@ -78,8 +298,230 @@ class DevOpsWorkItems:
             return 1
         return 0
     
+    def _load_yaml(self, path):
+        """Load a YAML file, reusing the cached parse if the file is unchanged.
+        
+        Args:
+            path (str): Path to the YAML file
+            
+        Returns:
+            dict: Parsed YAML data
+            
+        Raises:
+            FileNotFoundError: If the YAML file does not exist
+            yaml.YAMLError: If the YAML file cannot be parsed
+        """
+        stat = os.stat(path)
+        header = (stat.st_mtime_ns, stat.st_size)
+        cache_name = hashlib.sha1(os.path.abspath(path).encode()).hexdigest() + ".pkl"
+        cache_path = os.path.join(CACHE_DIR, cache_name)
+        
+        try:
+            with open(cache_path, "rb") as f:
+                if pickle.load(f) == header:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Using cached parse of {path}")
+                    return pickle.load(f)
+        except Exception:
+            # A missing, stale or corrupt cache is never fatal, parse the YAML instead
+            pass
+        
+        with open(path, 'r') as file:
+            data = yaml.load(file, Loader=SafeLoader)
+        
+        # Write to a temporary file first so readers never see a partial cache
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            temp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(temp_path, "wb") as f:
+                pickle.dump(header, f)
+                pickle.dump(data, f)
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Could not write YAML cache {cache_path}: {e}")
+        
+        return data
+    
+    def _az_defaults(self):
+        """Read the default organization and project configured for az devops.
+        
+        Returns:
+            tuple: Organization URL and project name, empty strings if not configured
+        """
+        result = self._run_az(("az", "devops", "configure", "--list"))
+        if result.returncode != 0:
+            logger.error(f"Error reading az devops defaults: {result.stderr}")
+            return "", ""
+        
+        config = configparser.ConfigParser()
+        try:
+            config.read_string(result.stdout)
+        except configparser.Error as e:
+            logger.error(f"Error parsing az devops defaults: {e}")
+            return "", ""
+        defaults = config["defaults"] if config.has_section("defaults") else {}
+        return defaults.get("organization", "").rstrip("/"), defaults.get("project", "")
+    
+    def _load_known_ids(self):
+        """Load the cached IDs of work items created by earlier runs.
+        
+        Returns:
+            dict: (parent ID, type, title, occurrence) to work item ID, with "" as the parent of Epics
+        """
+        if self._cache_scope is None:
+            return {}
+        with self._cache_lock:
+            rows = self._cache.execute(
+                "SELECT parent, type, title, occurrence, id FROM items WHERE scope = ?", (self._cache_scope,)
+            ).fetchall()
+        return {(parent, work_item_type, title, occurrence): work_item_id
+                for parent, work_item_type, title, occurrence, work_item_id in rows}
+    
+    def _remember_ids(self, rows):
+        """Cache the IDs of newly created work items.
+        
+        Args:
+            rows (list): (parent ID, type, title, occurrence, ID) tuples, with "" as the parent of Epics
+        """
+        if not rows or self._cache_scope is None:
+            return
+        with self._cache_lock, self._cache:
+            self._cache.executemany(
+                "INSERT OR REPLACE INTO items(scope, parent, type, title, occurrence, id) VALUES (?, ?, ?, ?, ?, ?)",
+                [(self._cache_scope, *row) for row in rows]
+            )
+    
+    def _forget_ids(self, work_item_ids):
+        """Drop deleted work items from the cache.
+        
+        Args:
+            work_item_ids (list): IDs of the deleted work items
+        """
+        if not work_item_ids or self._cache_scope is None:
+            return
+        with self._cache_lock, self._cache:
+            self._cache.executemany(
+                "DELETE FROM items WHERE scope = ? AND id = ?",
+                [(self._cache_scope, work_item_id) for work_item_id in work_item_ids]
+            )
+    
+    def _api_url(self, path):
+        """Build a work item tracking REST API URL for the configured project.
+        
+        Args:
+            path (str): Path below the _apis/wit resource
+            
+        Returns:
+            str: Absolute URL of the resource
+        """
+        return f"{self._org_url}/{quote(self._project)}/_apis/wit/{path}"
+    
+    def _work_item_url(self, work_item_id):
+        """Return the organization-level URL of a work item, as used in relations."""
+        return f"{self._org_url}/_apis/wit/workItems/{work_item_id}"
+    
+    def _work_item_patch(self, title, parent_id=None):
+        """Build the JSON-Patch document that creates a work item.
+        
+        Args:
+            title (str): Title of the work item
+            parent_id (str|int, optional): ID of the parent work item
+            
+        Returns:
+            list: JSON-Patch operations
+        """
+        patch = [{"op": "add", "path": "/fields/System.Title", "value": title}]
+        if parent_id:
+            patch.append({
+                "op": "add",
+                "path": "/relations/-",
+                "value": {
+                    "rel": "System.LinkTypes.Hierarchy-Reverse",
+                    "url": self._work_item_url(parent_id)
+                }
+            })
+        return patch
+    
+    def _submit_batch(self, operations):
+        """Send a list of operations to the work item $batch endpoint.
+        
+        Args:
+            operations (list): Batch operations (at most BATCH_SIZE)
+            
+        Returns:
+            list: One response entry per operation, or None if the request failed
+        """
+        try:
+            response = self._session.post(
+                f"{self._org_url}/_apis/wit/$batch",
+                params={"api-version": API_VERSION},
+                json=operations
+            )
+        except requests.RequestException as e:
+            logger.error(f"Error submitting batch request: {e}")
+            return None
+        if not response.ok:
+            logger.error(f"Error submitting batch request: {response.text}")
+            return None
+        
+        return _json.loads(response.content).get("value", [])
+    
+    def _run_az(self, command, text=True):
+        """Run an az command and capture its output.
+        
+        When azure-cli is importable the command runs in a pool of worker
+        processes that each load the Azure CLI once, which avoids starting a
+        new az interpreter per call. Otherwise az runs as a subprocess, as do
+        all later calls once the worker pool breaks. A call that may have
+        reached a broken worker is reported as failed, not retried, while a
+        call that never started falls back to a subprocess.
+        
+        Args:
+            command (tuple): Command line starting with "az"
+            text (bool): Return stdout and stderr as str instead of bytes
+            
+        Returns:
+            subprocess.CompletedProcess: Return code and captured output
+        """
+        pool = self._az_pool
+        if pool is not None:
+            try:
+                future = pool.submit(_invoke_az, list(command[1:]))
+            except RuntimeError as e:
+                # The pool broke or was shut down by another thread, nothing ran
+                self._drop_az_pool(pool, e)
+                future = None
+            if future is not None:
+                try:
+                    returncode, stdout, stderr = future.result()
+                except CancelledError:
+                    # Cancelled by a shutdown in another thread before it started
+                    returncode = None
+                except Exception as e:
+                    self._drop_az_pool(pool, e)
+                    returncode, stdout, stderr = 1, "", str(e)
+                if returncode is not None:
+                    if not text:
+                        stdout, stderr = stdout.encode(), stderr.encode()
+                    return subprocess.CompletedProcess(command, returncode, stdout, stderr)
+        
+        return subprocess.run(command, capture_output=True, text=text)
+    
+    def _drop_az_pool(self, pool, error):
+        """Stop using a failed az worker pool and run az as a subprocess instead.
+        
+        Args:
+            pool (ProcessPoolExecutor): The pool that failed
+            error (Exception): The error raised by the pool
+        """
+        if self._az_pool is pool:
+            logger.warning(f"az worker process failed, using subprocesses from now on: {error}")
+            self._az_pool = None
+            pool.shutdown(wait=False, cancel_futures=True)
+    
     def _create_work_item(self, work_item_type, title, parent_id=None):
-        """Create a single work item in Azure DevOps.
+        """Create a single work item using the Azure CLI.
         
         Args:
             work_item_type (str): Type of work item (Epic, Feature, Product Backlog Item)
@@ -87,38 +529,33 @@ class DevOpsWorkItems:
             parent_id (str, optional): ID of the parent work item
             
         Returns:
-            str: ID of the created work item, or None if creation failed
+            tuple: ID of the created work item (None if creation failed) and
+                whether it is linked to its parent
         """
-        command = [
-            "az", "boards", "work-item", "create",
-            "--type", work_item_type,
-            "--title", title,
-            "--query", "id",
-            "-o", "tsv"
-        ]
+        command = (*self._CREATE_PREFIX, "--type", work_item_type, "--title", title, *self._az_target_args)
         
         # Run the command and capture the work item ID
-        result = subprocess.run(command, capture_output=True, text=True)
+        result = self._run_az(command)
         if result.returncode != 0:
             logger.error(f"Error creating work item: {result.stderr}")
-            return None
+            return None, False
         
         work_item_id = result.stdout.strip()
         
         # Link to parent if specified
         if parent_id:
-            link_command = [
-                "az", "boards", "work-item", "relation", "add",
-                "--id", work_item_id,
-                "--relation-type", "Parent",
-                "--target-id", parent_id
-            ]
-            subprocess.run(link_command, check=True)
+            link_command = (*self._LINK_PREFIX, "--id", work_item_id, "--target-id", parent_id,
+                            *self._az_org_args)
+            link_result = self._run_az(link_command)
+            if link_result.returncode != 0:
+                # The work item exists, keep its ID so it is saved and can be deleted
+                logger.error(f"Error linking work item {work_item_id} to parent {parent_id}: {link_result.stderr}")
+                return work_item_id, False
         
-        return work_item_id
+        return work_item_id, True
     
     def _delete_work_item(self, work_item_id):
-        """Delete a single work item from Azure DevOps.
+        """Delete a single work item using the Azure CLI.
         
         Args:
             work_item_id (str): ID of the work item to delete
@@ -128,14 +565,10 @@ class DevOpsWorkItems:
         """
         if not work_item_id:
             return False
-            
-        command = [
-            "az", "boards", "work-item", "delete",
-            "--id", work_item_id,
-            "--yes"  # Skip confirmation prompt
-        ]
         
-        result = subprocess.run(command, capture_output=True, text=True)
+        command = (*self._DELETE_PREFIX, work_item_id, *self._az_target_args)
+        
+        result = self._run_az(command)
         if result.returncode != 0:
             logger.error(f"Error deleting work item {work_item_id}: {result.stderr}")
             return False
@@ -148,60 +581,249 @@ class DevOpsWorkItems:
         Args:
             data (dict): Data structure containing work item definitions
         """
-        created_items = []
+        known = self._load_known_ids()
+        created_items = new_created_items()
+        try:
+            if self._use_cli:
+                self._create_work_items_cli(data, known, created_items)
+            else:
+                self._create_work_items_rest(data, known, created_items)
+        finally:
+            # Save created items to a file for potential deletion later, also after a failed run
+            with open(CREATED_ITEMS_FILE, "wb") as f:
+                f.write(_json_dumps({"created_items": created_items}))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Saved {len(created_items['ids'])} created items to {CREATED_ITEMS_FILE}")
+    
+    def _create_work_items_cli(self, data, known, created_items):
+        """Create all work items using the Azure CLI, linking each to its parent.
+        
+        Args:
+            data (dict): Data structure containing work item definitions
+            known (dict): Cached IDs of work items that already exist
+            created_items (dict): Created work items, appended in place
+        """
+        epics = data['epics']
+        for epic, occurrence in zip(epics, title_occurrences(epics)):
+            self._create_epic_cli(epic, occurrence, known, created_items)
+    
+    def _create_epic_cli(self, epic, occurrence, known, created_items):
+        """Create one Epic and its subtree using the Azure CLI.
         
-        for epic in data['epics']:
+        The IDs of the new work items are cached when the Epic is done, or
+        when its creation is interrupted.
+        
+        Args:
+            epic (dict): Epic definition with its features and items
+            occurrence (int): Number of earlier Epics with the same title
+            known (dict): Cached IDs of work items that already exist
+            created_items (dict): Created work items, appended in place
+        """
+        new_rows = []
+        try:
             # Create Epic
-            epic_id = self._create_work_item("Epic", epic['title'])
-            logger.info(f"Created Epic: {epic['title']} (ID: {epic_id})")
-            created_items.append({"type": "Epic", "id": epic_id, "title": epic['title']})
+            epic_id, is_new, _ = self._create_unless_known(known, "Epic", epic['title'], occurrence)
+            logger.info(f"{'Created' if is_new else 'Found existing'} Epic: {epic['title']} (ID: {epic_id})")
+            add_created_item(created_items, "Epic", epic_id, epic['title'])
             
             if not epic_id:
                 logger.warning("Failed to create Epic. Skipping features.")
-                continue
+                return
+            if is_new:
+                new_rows.append(("", "Epic", epic['title'], occurrence, epic_id))
             
-            for feature in epic['features']:
-                # Create Feature
-                feature_id = self._create_work_item("Feature", feature['title'])
-                logger.info(f"  Created Feature: {feature['title']} (ID: {feature_id})")
-                created_items.append({"type": "Feature", "id": feature_id, "title": feature['title']})
+            # Features of an Epic are independent of each other, create them concurrently
+            features = epic['features']
+            feature_occurrences = title_occurrences(features)
+            feature_futures = [
+                self._executor.submit(self._create_unless_known, known, "Feature", feature['title'],
+                                      feature_occurrence, epic_id)
+                for feature, feature_occurrence in zip(features, feature_occurrences)
+            ]
+            for feature, feature_occurrence, feature_future in zip(features, feature_occurrences, feature_futures):
+                feature_id, is_new, linked = feature_future.result()
+                logger.info(f"  {'Created' if is_new else 'Found existing'} Feature: {feature['title']} (ID: {feature_id})")
+                add_created_item(created_items, "Feature", feature_id, feature['title'])
                 
                 if not feature_id:
                     logger.warning("  Failed to create Feature. Skipping items.")
                     continue
                 
-                # Link Feature to Epic (Epic is parent of Feature)
-                link_command = [
-                    "az", "boards", "work-item", "relation", "add",
-                    "--id", feature_id,
-                    "--relation-type", "Parent",
-                    "--target-id", epic_id
-                ]
-                subprocess.run(link_command, check=True)
+                # An unlinked Feature is not cached, so a re-run creates it again under its Epic
+                if is_new and linked:
+                    new_rows.append((epic_id, "Feature", feature['title'], feature_occurrence, feature_id))
                 
-                for item in feature['items']:
-                    # Create Product Backlog Item
-                    item_id = self._create_work_item("Product Backlog Item", item['title'])
-                    logger.info(f"    Created Item: {item['title']} (ID: {item_id})")
-                    created_items.append({"type": "Product Backlog Item", "id": item_id, "title": item['title']})
+                # Create the Product Backlog Items of the Feature concurrently
+                items = feature['items']
+                item_occurrences = title_occurrences(items)
+                item_futures = [
+                    self._executor.submit(self._create_unless_known, known, "Product Backlog Item",
+                                          item['title'], item_occurrence, feature_id)
+                    for item, item_occurrence in zip(items, item_occurrences)
+                ]
+                for item, item_occurrence, item_future in zip(items, item_occurrences, item_futures):
+                    item_id, is_new, linked = item_future.result()
+                    logger.info(f"    {'Created' if is_new else 'Found existing'} Item: {item['title']} (ID: {item_id})")
+                    add_created_item(created_items, "Product Backlog Item", item_id, item['title'])
                     
-                    # Only try to link if item was created successfully
-                    if item_id:
-                        # Link PBI to Feature (Feature is parent of PBI)
-                        link_command = [
-                            "az", "boards", "work-item", "relation", "add",
-                            "--id", item_id,
-                            "--relation-type", "Parent",
-                            "--target-id", feature_id
-                        ]
-                        subprocess.run(link_command, check=True)
-                    else:
+                    if not item_id:
                         logger.warning(f"    Failed to create work item for: {item['title']}")
+                    elif is_new and linked:
+                        new_rows.append((feature_id, "Product Backlog Item", item['title'], item_occurrence, item_id))
+        finally:
+            self._remember_ids(new_rows)
+    
+    def _create_unless_known(self, known, work_item_type, title, occurrence, parent_id=None):
+        """Create a work item unless the cache already holds its ID.
+        
+        Args:
+            known (dict): Cached IDs of work items that already exist
+            work_item_type (str): Type of work item (Epic, Feature, Product Backlog Item)
+            title (str): Title of the work item
+            occurrence (int): Number of earlier siblings with the same title
+            parent_id (str, optional): ID of the parent work item to link to
+            
+        Returns:
+            tuple: ID of the work item (None if creation failed), whether it was
+                created now and whether it is linked to its parent
+        """
+        work_item_id = known.get((parent_id or "", work_item_type, title, occurrence))
+        if work_item_id:
+            return work_item_id, False, True
+        work_item_id, linked = self._create_work_item(work_item_type, title, parent_id)
+        return work_item_id, True, linked
+    
+    def _create_work_items_rest(self, data, known, created_items):
+        """Create all work items using the REST $batch endpoint.
+        
+        Every work item gets a temporary negative ID so that children can
+        reference a parent created in the same batch. Parents created in an
+        earlier batch are referenced by their real ID.
+        
+        Whole Epic subtrees are packed into batches, so batches do not depend
+        on each other and are submitted concurrently. An Epic subtree larger
+        than one batch is split into batches that are submitted in order.
+        
+        Args:
+            data (dict): Data structure containing work item definitions
+            known (dict): Cached IDs of work items that already exist
+            created_items (dict): Created work items, appended in place
+        """
+        # Flatten each Epic subtree in creation order:
+        # (type, title, occurrence, temp ID, parent temp ID)
+        subtrees = []
+        next_ref = -1
+        epics = data['epics']
+        for epic, epic_occurrence in zip(epics, title_occurrences(epics)):
+            epic_ref, next_ref = next_ref, next_ref - 1
+            nodes = [("Epic", epic['title'], epic_occurrence, epic_ref, None)]
+            features = epic['features']
+            for feature, feature_occurrence in zip(features, title_occurrences(features)):
+                feature_ref, next_ref = next_ref, next_ref - 1
+                nodes.append(("Feature", feature['title'], feature_occurrence, feature_ref, epic_ref))
+                items = feature['items']
+                for item, item_occurrence in zip(items, title_occurrences(items)):
+                    nodes.append(("Product Backlog Item", item['title'], item_occurrence, next_ref, feature_ref))
+                    next_ref -= 1
+            subtrees.append(nodes)
+        
+        # Each group is a list of batches that must run in order
+        groups = []
+        current = []
+        for nodes in subtrees:
+            if current and len(current) + len(nodes) > BATCH_SIZE:
+                groups.append([current])
+                current = []
+            if len(nodes) > BATCH_SIZE:
+                groups.append([nodes[start:start + BATCH_SIZE] for start in range(0, len(nodes), BATCH_SIZE)])
+            else:
+                current.extend(nodes)
+        if current:
+            groups.append([current])
+        
+        futures = [self._executor.submit(self._create_batch_group, batches, known) for batches in groups]
+        for future in futures:
+            for field, values in future.result().items():
+                created_items[field].extend(values)
+    
+    def _create_batch_group(self, batches, known):
+        """Create a sequence of dependent batches in order.
+        
+        Args:
+            batches (list): Lists of (type, title, occurrence, temp ID, parent temp ID) tuples
+            known (dict): Cached IDs of work items that already exist
+            
+        Returns:
+            dict: Created work items as parallel types, ids and titles lists
+        """
+        created_items = new_created_items()
+        resolved = {}  # temp ID -> real ID (None if creation failed)
+        for nodes in batches:
+            self._create_batch(nodes, resolved, known, created_items)
+        return created_items
+    
+    def _create_batch(self, nodes, resolved, known, created_items):
+        """Create one chunk of flattened work items with a single $batch request.
+        
+        Work items found in the cache are not sent again.
+        
+        Args:
+            nodes (list): (type, title, occurrence, temp ID, parent temp ID) tuples
+            resolved (dict): Temp ID to real ID map, updated in place
+            known (dict): Cached IDs of work items that already exist
+            created_items (dict): Created work items, appended in place
+        """
+        operations = []
+        pending = []
+        for work_item_type, title, occurrence, ref, parent_ref in nodes:
+            parent = parent_ref
+            if parent_ref in resolved:
+                parent = resolved[parent_ref]
+                if not parent:
+                    # Parent failed in an earlier batch, nothing to link to
+                    logger.warning(f"Parent of {work_item_type} '{title}' was not created. Skipping.")
+                    resolved[ref] = None
+                    add_created_item(created_items, work_item_type, None, title)
+                    continue
+            
+            # Only a work item whose parent already exists can be in the cache
+            if parent_ref is None or parent_ref in resolved:
+                work_item_id = known.get((parent or "", work_item_type, title, occurrence))
+                if work_item_id:
+                    logger.info(f"Found existing {work_item_type}: {title} (ID: {work_item_id})")
+                    resolved[ref] = work_item_id
+                    add_created_item(created_items, work_item_type, work_item_id, title)
+                    continue
+            
+            body = [{"op": "add", "path": "/id", "value": ref}]
+            body.extend(self._work_item_patch(title, parent))
+            operations.append({
+                "method": "PATCH",
+                "uri": f"/{quote(self._project)}/_apis/wit/workitems/${quote(work_item_type)}?api-version={API_VERSION}",
+                "headers": JSON_PATCH_HEADERS,
+                "body": body
+            })
+            pending.append((work_item_type, title, occurrence, ref, parent_ref))
+        
+        if not operations:
+            return
         
-        # Save created items to a file for potential deletion later
-        with open("created_items.yaml", "w") as f:
-            yaml.dump({"created_items": created_items}, f)
-        logger.debug(f"Saved {len(created_items)} created items to created_items.yaml")
+        results = self._submit_batch(operations) or []
+        new_rows = []
+        for index, (work_item_type, title, occurrence, ref, parent_ref) in enumerate(pending):
+            work_item_id = None
+            if index < len(results) and results[index].get("code") == 200:
+                work_item_id = str(_json.loads(results[index]["body"])["id"])
+                logger.info(f"Created {work_item_type}: {title} (ID: {work_item_id})")
+            else:
+                error = results[index].get("body") if index < len(results) else "no response"
+                logger.error(f"Error creating {work_item_type} '{title}': {error}")
+            resolved[ref] = work_item_id
+            add_created_item(created_items, work_item_type, work_item_id, title)
+            if work_item_id:
+                new_rows.append((resolved.get(parent_ref) or "", work_item_type, title, occurrence, work_item_id))
+        
+        self._remember_ids(new_rows)
     
     def _delete_work_items(self, data):
         """Delete all work items defined in the data structure.
@@ -209,82 +831,261 @@ class DevOpsWorkItems:
         Args:
             data (dict): Data structure containing work item definitions
         """
-        # First try to load from created_items.yaml if it exists
-        try:
-            with open("created_items.yaml", "r") as f:
-                created_items = yaml.safe_load(f)
-                if created_items and "created_items" in created_items:
-                    self._delete_from_created_items(created_items["created_items"])
-                    return
-        except FileNotFoundError:
-            logger.warning("No created_items.yaml file found. Attempting to delete based on input YAML...")
+        # First try the list saved by a previous create run
+        created_items = self._load_created_items()
+        if created_items is not None:
+            self._delete_from_created_items(created_items)
+            return
+        
+        if not data or not data.get('epics'):
+            logger.info("No epics defined in the YAML file. Nothing to delete.")
+            return
         
-        # If no created_items.yaml, try to find and delete based on titles
+        # If there is no saved list, try to find and delete based on titles
         logger.info("Searching for work items to delete based on titles in the YAML file...")
         
-        # Delete in reverse order (PBIs first, then Features, then Epics)
-        for epic in data['epics']:
-            for feature in epic['features']:
-                for item in feature['items']:
-                    # Find and delete PBI by title
-                    self._find_and_delete_by_title("Product Backlog Item", item['title'])
-                
-                # Find and delete Feature by title
-                self._find_and_delete_by_title("Feature", feature['title'])
-            
-            # Find and delete Epic by title
-            self._find_and_delete_by_title("Epic", epic['title'])
+        # Every (type, title) in deletion order: PBIs first, then Features, then Epics
+        epics = data['epics']
+        targets = ([("Product Backlog Item", item['title']) for epic in epics
+                    for feature in epic['features'] for item in feature['items']]
+                   + [("Feature", feature['title']) for epic in epics for feature in epic['features']]
+                   + [("Epic", epic['title']) for epic in epics])
+        
+        # Resolve every title up front with one WIQL query per work item type
+        titles_by_type = {}
+        for work_item_type, title in targets:
+            titles_by_type.setdefault(work_item_type, []).append(title)
+        futures = {work_item_type: self._executor.submit(self._find_by_titles, work_item_type, titles)
+                   for work_item_type, titles in titles_by_type.items()}
+        found = {}
+        for work_item_type, future in futures.items():
+            for work_item_id, title in future.result() or []:
+                found.setdefault((work_item_type, title.casefold()), []).append(work_item_id)
+        
+        work_items = []
+        seen = set()
+        for work_item_type, title in targets:
+            work_item_ids = found.get((work_item_type, title.casefold()))
+            if not work_item_ids:
+                logger.warning(f"No {work_item_type} found with title: {title}")
+                continue
+            for work_item_id in work_item_ids:
+                if work_item_id not in seen:
+                    seen.add(work_item_id)
+                    logger.info(f"Found {work_item_type}: {title} (ID: {work_item_id})")
+                    work_items.append((work_item_type, work_item_id, title))
+        
+        if not self._use_cli:
+            self._forget_ids(self._delete_batch(work_items))
+            return
+        
+        # Deletions of one work item type are independent and run concurrently
+        deleted = []
+        for work_item_type, group in groupby(work_items, key=itemgetter(0)):
+            work_item_ids = [work_item_id for _, work_item_id, _ in group]
+            results = self._executor.map(partial(self._delete_and_report, work_item_type), work_item_ids)
+            deleted.extend(work_item_id for work_item_id, ok in zip(work_item_ids, results) if ok)
+        self._forget_ids(deleted)
+    
+    def _load_created_items(self):
+        """Load the work items saved by a previous create run.
+        
+        Reads created_items.json, falling back to the created_items.yaml
+        written by older versions of this tool.
+        
+        Returns:
+            dict: Saved work items as parallel types, ids and titles lists,
+                or None if no usable saved list exists
+        """
+        try:
+            with open(CREATED_ITEMS_FILE, "rb") as f:
+                saved = _json.loads(f.read())
+        except FileNotFoundError:
+            try:
+                with open(LEGACY_CREATED_ITEMS_FILE, "r") as f:
+                    saved = yaml.load(f, Loader=SafeLoader)
+            except FileNotFoundError:
+                logger.warning(f"No {CREATED_ITEMS_FILE} file found. Attempting to delete based on input YAML...")
+                return None
+        except _json.JSONDecodeError as e:
+            logger.warning(f"Could not parse {CREATED_ITEMS_FILE} ({e}). Attempting to delete based on input YAML...")
+            return None
+        
+        if not saved or "created_items" not in saved:
+            return None
+        created_items = saved["created_items"]
+        if isinstance(created_items, list):
+            # Older files store one {type, id, title} dict per work item
+            legacy, created_items = created_items, new_created_items()
+            for item in legacy:
+                add_created_item(created_items, item["type"], item.get("id"), item["title"])
+        return created_items
     
     def _delete_from_created_items(self, created_items):
         """Delete work items from a saved list.
         
         Args:
-            created_items (list): List of work items to delete
+            created_items (dict): Work items to delete, as parallel types, ids and titles lists
         """
         # Delete in reverse order (last created first)
-        logger.info(f"Deleting {len(created_items)} work items from saved list...")
-        for item in reversed(created_items):
-            if "id" in item and item["id"]:
-                logger.info(f"Deleting {item['type']}: {item['title']} (ID: {item['id']})")
-                if self._delete_work_item(item["id"]):
-                    logger.info(f"  Successfully deleted {item['type']} with ID {item['id']}")
+        logger.info(f"Deleting {len(created_items['ids'])} work items from saved list...")
+        work_items = [(work_item_type, work_item_id, title) for work_item_type, work_item_id, title
+                      in zip(reversed(created_items["types"]), reversed(created_items["ids"]),
+                             reversed(created_items["titles"]))
+                      if work_item_id]
+        if not self._use_cli:
+            self._forget_ids(self._delete_batch(work_items))
+            return
+        
+        deleted = []
+        for work_item_type, work_item_id, title in work_items:
+            logger.info(f"Deleting {work_item_type}: {title} (ID: {work_item_id})")
+            if self._delete_work_item(work_item_id):
+                logger.info(f"  Successfully deleted {work_item_type} with ID {work_item_id}")
+                deleted.append(work_item_id)
+            else:
+                logger.error(f"  Failed to delete {work_item_type} with ID {work_item_id}")
+        self._forget_ids(deleted)
+    
+    def _delete_batch(self, work_items):
+        """Delete work items with $batch requests of up to BATCH_SIZE operations.
+        
+        Batches are sent in order, so children listed first are deleted first.
+        
+        Args:
+            work_items (list): (type, ID, title) tuples of the work items to delete
+            
+        Returns:
+            list: IDs of the work items that were deleted
+        """
+        deleted = []
+        for start in range(0, len(work_items), BATCH_SIZE):
+            chunk = work_items[start:start + BATCH_SIZE]
+            operations = [{
+                "method": "DELETE",
+                "uri": f"/_apis/wit/workitems/{work_item_id}?api-version={API_VERSION}",
+                "headers": {"Content-Type": "application/json"}
+            } for _, work_item_id, _ in chunk]
+            
+            results = self._submit_batch(operations) or []
+            for index, (work_item_type, work_item_id, title) in enumerate(chunk):
+                logger.info(f"Deleting {work_item_type}: {title} (ID: {work_item_id})")
+                if index < len(results) and 200 <= results[index].get("code", 0) < 300:
+                    logger.info(f"  Successfully deleted {work_item_type} with ID {work_item_id}")
+                    deleted.append(work_item_id)
                 else:
-                    logger.error(f"  Failed to delete {item['type']} with ID {item['id']}")
+                    logger.error(f"  Failed to delete {work_item_type} with ID {work_item_id}")
+        return deleted
+    
+    def _delete_and_report(self, work_item_type, work_item_id):
+        """Delete a single work item and log the outcome.
+        
+        Args:
+            work_item_type (str): Type of the work item, used in log messages
+            work_item_id (str): ID of the work item to delete
+            
+        Returns:
+            bool: True if deletion was successful, False otherwise
+        """
+        if self._delete_work_item(work_item_id):
+            logger.info(f"  Successfully deleted {work_item_type} with ID {work_item_id}")
+            return True
+        logger.error(f"  Failed to delete {work_item_type} with ID {work_item_id}")
+        return False
     
-    def _find_and_delete_by_title(self, work_item_type, title):
-        """Find and delete work items by type and title.
+    def _find_by_titles(self, work_item_type, titles):
+        """Find work items of one type by a list of titles.
         
         Args:
             work_item_type (str): Type of work item to find
-            title (str): Title of the work item to find
+            titles (list): Titles of the work items to find
+            
+        Returns:
+            list: (ID, title) tuples of matching work items, or None if a query failed
         """
-        # Find work item by title and type
-        find_command = [
-            "az", "boards", "query",
-            "--wiql", f"SELECT [System.Id] FROM WorkItems WHERE [System.WorkItemType] = '{work_item_type}' AND [System.Title] = '{title}'",
-            "-o", "json"
-        ]
+        head = (self._WIQL_PREFIX + work_item_type.translate(self._QUOTE_ESCAPE)
+                + "' AND [System.Title] IN (")
         
-        result = subprocess.run(find_command, capture_output=True, text=True)
-        if result.returncode != 0:
-            logger.error(f"Error finding {work_item_type} '{title}': {result.stderr}")
-            return
+        # Split the titles so every query stays below the WIQL length limit
+        chunks = [[]]
+        length = len(head) + 1
+        for title in titles:
+            quoted = "'" + title.translate(self._QUOTE_ESCAPE) + "'"
+            if chunks[-1] and length + len(quoted) + 1 > WIQL_MAX_LENGTH:
+                chunks.append([])
+                length = len(head) + 1
+            chunks[-1].append(quoted)
+            length += len(quoted) + 1
+        
+        matches = []
+        for chunk in chunks:
+            if not chunk:
+                continue
+            items = self._query_work_items(head + ",".join(chunk) + ")")
+            if items is None:
+                logger.error(f"Error finding {work_item_type} work items")
+                return None
+            matches.extend(items)
+        return matches
+    
+    def _query_work_items(self, wiql):
+        """Run a WIQL query and return the IDs and titles of the matches.
+        
+        Args:
+            wiql (str): WIQL query selecting [System.Id] and [System.Title]
+            
+        Returns:
+            list: (ID, title) tuples, or None if the query failed
+        """
+        if self._use_cli:
+            find_command = (*self._QUERY_PREFIX, wiql, *self._az_target_args)
+            
+            # Keep stdout as bytes, the JSON decoder reads them without a decode step
+            result = self._run_az(find_command, text=False)
+            if result.returncode != 0:
+                logger.error(f"Error running work item query: {result.stderr.decode(errors='replace')}")
+                return None
+            
+            try:
+                items = _json.loads(result.stdout)
+            except _json.JSONDecodeError:
+                logger.error("Error parsing work item query response")
+                return None
+            return [(str(item["id"]), item.get("fields", {}).get("System.Title", ""))
+                    for item in items or []]
         
         try:
-            import json
-            items = json.loads(result.stdout)
-            if items and len(items) > 0:
-                for item in items:
-                    work_item_id = str(item.get("id"))
-                    logger.info(f"Found {work_item_type}: {title} (ID: {work_item_id})")
-                    if self._delete_work_item(work_item_id):
-                        logger.info(f"  Successfully deleted {work_item_type} with ID {work_item_id}")
-                    else:
-                        logger.error(f"  Failed to delete {work_item_type} with ID {work_item_id}")
-            else:
-                logger.warning(f"No {work_item_type} found with title: {title}")
-        except json.JSONDecodeError:
-            logger.error(f"Error parsing response when finding {work_item_type} '{title}'")
+            response = self._session.post(
+                self._api_url("wiql"),
+                params={"api-version": API_VERSION},
+                json={"query": wiql}
+            )
+        except requests.RequestException as e:
+            logger.error(f"Error running work item query: {e}")
+            return None
+        if not response.ok:
+            logger.error(f"Error running work item query: {response.text}")
+            return None
+        ids = [item["id"] for item in _json.loads(response.content).get("workItems", [])]
+        
+        # WIQL only returns references, fetch the titles in bulk
+        items = []
+        for start in range(0, len(ids), BATCH_SIZE):
+            try:
+                response = self._session.post(
+                    self._api_url("workitemsbatch"),
+                    params={"api-version": API_VERSION},
+                    json={"ids": ids[start:start + BATCH_SIZE], "fields": ["System.Title"]}
+                )
+            except requests.RequestException as e:
+                logger.error(f"Error fetching work items: {e}")
+                return None
+            if not response.ok:
+                logger.error(f"Error fetching work items: {response.text}")
+                return None
+            items.extend((str(item["id"]), item["fields"].get("System.Title", ""))
+                         for item in _json.loads(response.content).get("value", []))
+        return items
 
 def main():
     """Main entry point for the script."""